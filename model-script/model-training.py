@@ -11,7 +11,7 @@ Enhanced features:
 
 Prerequisites:
 - Python 3.8+
-- scikit-learn, pandas, numpy, joblib, requests, colorama packages
+- scikit-learn, pandas, numpy, joblib, requests, pyarrow, colorama packages
 - Lighthouse Storage API key
 """
 
@@ -20,15 +20,23 @@ import json
 import requests
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, ENGLISH_STOP_WORDS
 from sklearn.metrics.pairwise import cosine_similarity
 import joblib
 import tempfile
 import re
-from collections import defaultdict
+from collections import defaultdict, Counter, deque
 import time
 from datetime import datetime
 import sys
+import threading
+import hashlib
+import zlib
+import math
+import glob
+import itertools
+import argparse
+import unicodedata
 
 # Try to import colorama for colored output
 try:
@@ -70,7 +78,15 @@ FALLBACK_MONUMENTS = [
         "type": "Castle Complex",
         "significance": "Official residence of the President of the Czech Republic, seat of Bohemian kings and Holy Roman emperors",
         "notable_figures": ["Prince Bořivoj", "Charles IV", "Rudolf II"],
-        "historical_events": ["Founded by Prince Bořivoj around 880", "Became seat of Holy Roman Emperor", "St. Vitus Cathedral construction started in 1344"]
+        "historical_events": ["Founded by Prince Bořivoj around 880", "Became seat of Holy Roman Emperor", "St. Vitus Cathedral construction started in 1344"],
+        "translations": {
+            "cs": {
+                "name": "Pražský hrad",
+                "description": "Pražský hrad je hradní komplex založený v 9. století. Podle Guinnessovy knihy rekordů je největším starobylým hradním komplexem na světě s rozlohou téměř 70 000 m². Již přes tisíc let je symbolem české státnosti a sídlem českých králů, římských císařů a prezidentů republiky.",
+                "location": "Hradčany, Pražský hrad",
+                "type": "Hradní komplex"
+            }
+        }
     },
     {
         "name": "Charles Bridge",
@@ -82,7 +98,15 @@ FALLBACK_MONUMENTS = [
         "type": "Bridge",
         "significance": "One of Prague's most iconic landmarks, adorned with 30 baroque statues",
         "notable_figures": ["Charles IV", "Peter Parler"],
-        "historical_events": ["Construction began in 1357", "Completed in early 15th century", "Baroque statues added in 17th-18th centuries"]
+        "historical_events": ["Construction began in 1357", "Completed in early 15th century", "Baroque statues added in 17th-18th centuries"],
+        "translations": {
+            "cs": {
+                "name": "Karlův most",
+                "description": "Karlův most je historický kamenný gotický most, který spojuje Staré Město a Malou Stranu. Byl postaven jako náhrada Juditina mostu poškozeného povodní v roce 1342. Stavba začala za Karla IV. v roce 1357 a most zdobí 30 barokních soch.",
+                "location": "Přes Vltavu, spojuje Staré Město a Malou Stranu",
+                "type": "Most"
+            }
+        }
     },
     {
         "name": "Old Town Square",
@@ -94,7 +118,15 @@ FALLBACK_MONUMENTS = [
         "type": "Historic Square",
         "significance": "Historic center of Prague, site of many important historical events",
         "notable_figures": ["Jan Hus"],
-        "historical_events": ["Medieval marketplace", "Site of Jan Hus execution in 1415", "1968 demonstrations"]
+        "historical_events": ["Medieval marketplace", "Site of Jan Hus execution in 1415", "1968 demonstrations"],
+        "translations": {
+            "cs": {
+                "name": "Staroměstské náměstí",
+                "description": "Staroměstské náměstí je historické náměstí na Starém Městě v Praze. Najdete zde gotické kostely, barevné barokní domy, pomník mistra Jana Husa a slavný orloj.",
+                "location": "Staré Město, Praha",
+                "type": "Historické náměstí"
+            }
+        }
     },
     {
         "name": "Astronomical Clock",
@@ -106,7 +138,15 @@ FALLBACK_MONUMENTS = [
         "type": "Astronomical Clock",
         "significance": "Third-oldest astronomical clock in the world, major tourist attraction",
         "notable_figures": ["Master Hanuš", "Mikuláš of Kadaň"],
-        "historical_events": ["Installed in 1410", "Legend of Master Hanuš blinding", "Renovated multiple times"]
+        "historical_events": ["Installed in 1410", "Legend of Master Hanuš blinding", "Renovated multiple times"],
+        "translations": {
+            "cs": {
+                "name": "Pražský orloj",
+                "description": "Pražský orloj jsou středověké astronomické hodiny na Staroměstské radnici, instalované v roce 1410. Jde o třetí nejstarší astronomické hodiny na světě a nejstarší dosud fungující.",
+                "location": "Staroměstská radnice, Staroměstské náměstí",
+                "type": "Astronomické hodiny"
+            }
+        }
     },
     {
         "name": "St. Vitus Cathedral",
@@ -118,24 +158,159 @@ FALLBACK_MONUMENTS = [
         "type": "Cathedral",
         "significance": "Most important church in Czech Republic, coronation site of Bohemian kings",
         "notable_figures": ["Charles IV", "Peter Parler", "Matthias of Arras"],
-        "historical_events": ["Construction started by Charles IV in 1344", "Completed in 1929", "Coronations of Bohemian kings"]
+        "historical_events": ["Construction started by Charles IV in 1344", "Completed in 1929", "Coronations of Bohemian kings"],
+        "translations": {
+            "cs": {
+                "name": "Katedrála svatého Víta",
+                "description": "Katedrála svatého Víta je římskokatolická metropolitní katedrála v areálu Pražského hradu a sídlo pražského arcibiskupa. Stavbu zahájil Karel IV. v roce 1344 a dokončena byla v roce 1929. Konaly se zde korunovace českých králů.",
+                "location": "Areál Pražského hradu",
+                "type": "Katedrála"
+            }
+        }
     }
 ]
 
+# Session event log: append-only JSONL with size-based rotation, compacted to Parquet
+SESSION_LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prague_qna_logs")
+SESSION_LOG_FILE = "session_events.jsonl"
+SESSION_LOG_MAX_BYTES = 5 * 1024 * 1024
+HISTORY_RING_SIZE = 200
+
+# Persisted search index used for instant startup while remote data loads.
+# Kept next to this script rather than in the working directory, since it is unpickled on startup.
+INDEX_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prague_qna_index.joblib")
+
+# Attributes that make up a complete, swappable search index
+INDEX_STATE_ATTRS = (
+    'monuments', 'monument_texts', 'monument_fields', 'tfidf_vectorizer', 'tfidf_matrix',
+    'monument_keywords', 'facet_index', 'bm25f_postings', 'bm25f_weights'
+)
+
+# TF-IDF vectorizer settings and scoring knobs (see --evaluate for the trade-offs)
+TFIDF_PARAMS = {
+    'max_features': 2000,
+    'ngram_range': (1, 3),
+    'max_df': 0.95
+}
+KEYWORD_BOOST = 0.2
+SCORE_THRESHOLD = 0.01
+
+# Settings explored by the retrieval parameter sweep
+SWEEP_GRID = {
+    'max_features': [500, 1000, 2000, 5000, None],
+    'ngram_range': [(1, 1), (1, 2), (1, 3)],
+    'max_df': [0.8, 0.95, 1.0],
+    'keyword_boost': [0.0, 0.1, 0.2, 0.3],
+    'score_threshold': [0.0, 0.01, 0.05]
+}
+
+# Default labelled questions for offline evaluation against FALLBACK_MONUMENTS
+EVAL_QUESTIONS = [
+    {"question": "What is Prague Castle?", "relevant": ["Prague Castle"]},
+    {"question": "When was Charles Bridge built?", "relevant": ["Charles Bridge"]},
+    {"question": "Where is the Astronomical Clock located?", "relevant": ["Astronomical Clock"]},
+    {"question": "Who built St. Vitus Cathedral?", "relevant": ["St. Vitus Cathedral"]},
+    {"question": "What happened at Old Town Square?", "relevant": ["Old Town Square"]},
+    {"question": "Which monument was founded by Prince Bořivoj?", "relevant": ["Prague Castle"]},
+    {"question": "Where was Jan Hus executed?", "relevant": ["Old Town Square"]},
+    {"question": "Who was Master Hanuš?", "relevant": ["Astronomical Clock"]},
+    {"question": "Which bridge replaced the Judith Bridge?", "relevant": ["Charles Bridge"]},
+    {"question": "Where were the Bohemian kings crowned?", "relevant": ["St. Vitus Cathedral", "Prague Castle"]},
+    {"question": "Which monuments did Peter Parler work on?", "relevant": ["Charles Bridge", "St. Vitus Cathedral"]}
+]
+
+# Per-language analysis: English is served by the main index, other language shards are built on first use
+LANGUAGE_ANALYZERS = {'cs': 'czech_analyzer'}
+CZECH_CHARACTERS = set('áčďéěíňóřšťúůýž')
+DIACRITIC_EVIDENCE_WEIGHT = 0.5  # Czech place and person names also appear in English questions
+
+# Czech stop words and light stemming suffixes, written without diacritics
+CZECH_STOP_WORDS = {
+    'a', 'aby', 'ale', 'ani', 'co', 'ci', 'do', 'i', 'jak', 'jaky', 'jaka', 'jake', 'je', 'jsou', 'k', 'kde',
+    'kdo', 'kdy', 'kdyz', 'ktery', 'ktera', 'ktere', 'kolik', 'ma', 'na', 'nad', 'o', 'od', 'po', 'pod', 'pro',
+    'proc', 'pri', 'pres', 's', 'se', 'si', 'v', 've', 'z', 'za', 'ze', 'byl', 'byla', 'bylo', 'byly', 'jsem',
+    'ten', 'ta', 'to', 'tento', 'tak', 'jeho', 'jejich', 'mi', 'mne', 'me'
+}
+CZECH_SUFFIXES = (
+    'atech', 'etem', 'atum', 'ovi', 'ove', 'ova', 'ovy', 'ych', 'ymi', 'ami', 'emi', 'ach', 'ech', 'ich',
+    'ata', 'aty', 'uv', 'ou', 'em', 'um', 'ym', 'im', 'ho', 'mu', 'a', 'e', 'i', 'o', 'u', 'y'
+)
+
+# Available ranking engines
+RANKERS = ('tfidf', 'bm25f')
+
+# BM25F field weights, saturation and length normalization
+BM25F_FIELD_WEIGHTS = {
+    'name': 3.0,
+    'type': 2.0,
+    'architecture_style': 2.0,
+    'notable_figures': 1.5,
+    'location': 1.5,
+    'historical_period': 1.0,
+    'construction_year': 1.0,
+    'significance': 1.0,
+    'description': 1.0,
+    'historical_events': 1.0
+}
+BM25F_K1 = 1.2
+BM25F_B = 0.75
+
+# MinHash/LSH settings for near-duplicate record detection
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+MINHASH_SEED = 42
+MINHASH_PRIME = (1 << 61) - 1
+NEAR_DUPLICATE_THRESHOLD = 0.7
+
+# Facets indexed as bitmaps for pre-filtering candidates before scoring
+FACET_FIELDS = ('type', 'style', 'period')
+
+# Score added per facet when a question mentions a monument's type, style or period
+FACET_BOOST = 0.1
+
+# Generic terms that should never count as facet matches
+FACET_STOPWORDS = {'historic', 'complex', 'century', 'centuries', 'present', 'and', 'the'}
+
 class EnhancedPragueQnA:
     def __init__(self):
         self.monuments = []
         self.monument_texts = []
+        self.monument_fields = []
         self.tfidf_vectorizer = None
         self.tfidf_matrix = None
-        self.keyword_index = defaultdict(list)
-        self.question_history = []
+        self.monument_keywords = []
+        self.facet_index = {facet: {} for facet in FACET_FIELDS}
+        self.bm25f_postings = {}
+        self.bm25f_weights = dict(BM25F_FIELD_WEIGHTS)
+        self.ranker = 'tfidf'
+        self.language_shards = {}
+        self.last_language = 'en'
+        self.last_engine = 'tfidf'
+        self.tfidf_params = dict(TFIDF_PARAMS)
+        self.keyword_boost = KEYWORD_BOOST
+        self.score_threshold = SCORE_THRESHOLD
+        self.active_filters = {}
+        self.last_filters = {}
+        self.last_facet_boosts = {}
+        self.index_lock = threading.RLock()
+        self.index_source = None
+        self.loader_thread = None
+        self.remote_loaded = 0
+        self.verbose = True
+        self.duplicates_merged = {'exact': 0, 'near': 0}
+        self.question_history = deque(maxlen=HISTORY_RING_SIZE)
+        self.event_log_dir = SESSION_LOG_DIR
         self.session_stats = {
             'questions_asked': 0,
             'session_start': datetime.now(),
             'monuments_referenced': set()
         }
         
+    def log(self, message):
+        """Print plain progress output unless running quietly"""
+        if self.verbose:
+            print(message)
+    
     def print_colored(self, text, color=Fore.WHITE, style=Style.NORMAL):
         """Print colored text if colorama is available"""
         if COLORS_AVAILABLE:
@@ -168,6 +343,12 @@ class EnhancedPragueQnA:
 │   stats, statistics   - Show session statistics                            │
 │   list, monuments     - List available monuments                           │
 │   export              - Export session data                                │
+│   compact             - Roll rotated event logs into Parquet               │
+│   filter f=value ...  - Restrict search by facet (type, style, period)     │
+│   filter clear        - Remove all facet filters                           │
+│   filters, facets     - Show active filters and available facet values     │
+│   ranker tfidf|bm25f  - Switch the ranking engine                          │
+│   weights f=w ...     - Set BM25F field weights, e.g. weights name=4       │
 │   clear, cls          - Clear screen                                       │
 │   quit, exit, q       - Exit the program                                   │
 │                                                                             │
@@ -265,6 +446,10 @@ Try asking questions in natural language - the system understands context!
 │ Session Duration:     {duration_str:<50} │
 │ Questions Asked:      {self.session_stats['questions_asked']:<50} │
 │ Monuments in DB:      {len(self.monuments):<50} │
+│ Index Source:         {self.index_source or 'none':<50} │
+│ Ranker:               {self.ranker:<50} │
+│ Language Shards:      {', '.join(['en'] + sorted(self.language_shards)):<50} │
+│ Duplicates Merged:    {sum(self.duplicates_merged.values()):<50} │
 │ Monuments Referenced: {len(self.session_stats['monuments_referenced']):<50} │
 │ Vocabulary Size:      {len(self.tfidf_vectorizer.vocabulary_) if self.tfidf_vectorizer else 0:<50} │
 └─────────────────────────────────────────────────────────────────────────────┘
@@ -325,6 +510,171 @@ Try asking questions in natural language - the system understands context!
         except Exception as e:
             self.print_colored(f"✗ Export failed: {e}", Fore.RED)
     
+    def show_facets(self):
+        """Show active filters and available facet values"""
+        if self.active_filters:
+            active = ', '.join(f"{facet}={'|'.join(values)}" for facet, values in self.active_filters.items())
+            self.print_colored(f"\n🔎 Active filters: {active}", Fore.GREEN, Style.BRIGHT)
+        else:
+            self.print_colored("\n🔎 No active filters (facets in your question boost matching monuments).", Fore.YELLOW)
+        
+        self.print_colored("─" * 80, Fore.MAGENTA)
+        for facet in FACET_FIELDS:
+            values = sorted(self.facet_index.get(facet, {}).keys())
+            self.print_colored(f"{facet:<8} {', '.join(values) if values else '-'}", Fore.CYAN)
+        self.print_colored("─" * 80, Fore.MAGENTA)
+    
+    def set_filters(self, args):
+        """Parse 'facet=value' arguments from the filter command"""
+        if not args:
+            self.show_facets()
+            return
+        
+        if args == ['clear']:
+            self.active_filters = {}
+            self.print_colored("✓ Facet filters cleared", Fore.GREEN)
+            return
+        
+        filters = {}
+        for arg in args:
+            if '=' not in arg:
+                self.print_colored(f"✗ Invalid filter '{arg}'. Use facet=value, e.g. style=gothic", Fore.RED)
+                return
+            facet, value = arg.split('=', 1)
+            facet = facet.strip().lower()
+            if facet not in FACET_FIELDS:
+                self.print_colored(f"✗ Unknown facet '{facet}'. Available: {', '.join(FACET_FIELDS)}", Fore.RED)
+                return
+            values = [self.normalize_facet_term(v) for v in value.split('|') if v.strip()]
+            available = self.facet_index.get(facet, {})
+            if not values:
+                self.print_colored(f"✗ No value given for '{facet}'. Use facet=value, e.g. style=gothic", Fore.RED)
+                return
+            unknown = [v for v in values if v not in available]
+            if unknown:
+                self.print_colored(f"✗ Unknown {facet} value(s): {', '.join(unknown)}", Fore.RED)
+                self.print_colored(f"   Available: {', '.join(sorted(available)) or '-'}", Fore.YELLOW)
+                return
+            filters.setdefault(facet, []).extend(values)
+        
+        self.active_filters = filters
+        self.show_facets()
+    
+    def set_ranker(self, args):
+        """Show or switch the ranking engine"""
+        if not args:
+            self.print_colored(f"Current ranker: {self.ranker} (available: {', '.join(RANKERS)})", Fore.CYAN)
+            return
+        
+        if args[0] not in RANKERS:
+            self.print_colored(f"✗ Unknown ranker '{args[0]}'. Available: {', '.join(RANKERS)}", Fore.RED)
+            return
+        
+        self.ranker = args[0]
+        self.print_colored(f"✓ Ranker set to {self.ranker}", Fore.GREEN)
+    
+    def set_field_weights(self, args):
+        """Show or update BM25F field weights and rebuild the BM25F postings"""
+        if args:
+            weights = dict(self.bm25f_weights)
+            for arg in args:
+                field, _, value = arg.partition('=')
+                if field not in BM25F_FIELD_WEIGHTS:
+                    self.print_colored(f"✗ Unknown field '{field}'. Available: {', '.join(BM25F_FIELD_WEIGHTS)}", Fore.RED)
+                    return
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = None
+                if weight is None or not math.isfinite(weight) or weight <= 0:
+                    self.print_colored(f"✗ Invalid weight '{arg}'. Use field=positive number, e.g. name=4", Fore.RED)
+                    return
+                weights[field] = weight
+            
+            with self.index_lock:
+                self.bm25f_weights = weights
+                self.build_bm25f_index()
+            self.print_colored("✓ BM25F field weights updated", Fore.GREEN)
+        
+        for field, weight in self.bm25f_weights.items():
+            self.print_colored(f"   {field:<20} {weight:g}", Fore.CYAN)
+    
+    def monument_id(self, monument):
+        """Stable identifier for a monument record"""
+        return self.safe_string(monument.get('id', monument.get('name', '')))
+    
+    def log_event(self, question, results, latency_ms):
+        """Append one answered question to the rotating JSONL event log"""
+        if not self.event_log_dir:
+            return
+        
+        event = {
+            'timestamp': datetime.now().isoformat(),
+            'session_start': self.session_stats['session_start'].isoformat(),
+            'question': ' '.join(question.lower().split()),
+            'ranker': self.last_engine,
+            'language': self.last_language,
+            'result_ids': [self.monument_id(result['monument']) for result in results],
+            'scores': [round(float(result['score']), 6) for result in results],
+            'latency_ms': round(latency_ms, 3)
+        }
+        
+        try:
+            os.makedirs(self.event_log_dir, exist_ok=True)
+            log_path = os.path.join(self.event_log_dir, SESSION_LOG_FILE)
+            if os.path.exists(log_path) and os.path.getsize(log_path) >= SESSION_LOG_MAX_BYTES:
+                self.rotate_event_log()
+            with open(log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self.print_colored(f"✗ Event log write failed, logging disabled: {e}", Fore.RED)
+            self.event_log_dir = None
+    
+    def rotate_event_log(self):
+        """Close the active event log by renaming it with a timestamp"""
+        log_path = os.path.join(self.event_log_dir, SESSION_LOG_FILE)
+        if not os.path.exists(log_path) or os.path.getsize(log_path) == 0:
+            return None
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        rotated_path = os.path.join(self.event_log_dir, f"session_events_{timestamp}.jsonl")
+        os.replace(log_path, rotated_path)
+        return rotated_path
+    
+    def compact_session_logs(self):
+        """Roll the JSONL event logs into a single Parquet file for offline analytics"""
+        if not self.event_log_dir or not os.path.isdir(self.event_log_dir):
+            self.print_colored("No event logs to compact.", Fore.YELLOW)
+            return None
+        
+        self.rotate_event_log()
+        log_files = sorted(glob.glob(os.path.join(self.event_log_dir, "session_events_*.jsonl")))
+        if not log_files:
+            self.print_colored("No event logs to compact.", Fore.YELLOW)
+            return None
+        
+        try:
+            events = pd.concat([pd.read_json(path, lines=True, dtype=False) for path in log_files], ignore_index=True)
+            events['timestamp'] = pd.to_datetime(events['timestamp'])
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            parquet_path = os.path.join(self.event_log_dir, f"session_events_{timestamp}.parquet")
+            if os.path.exists(parquet_path):
+                self.print_colored(f"✗ Compaction target already exists, logs left in place: {parquet_path}", Fore.RED)
+                return None
+            events.to_parquet(parquet_path, index=False)
+        except ImportError as e:
+            self.print_colored(f"✗ Parquet support missing, install 'pyarrow': {e}", Fore.RED)
+            return None
+        except Exception as e:
+            self.print_colored(f"✗ Compaction failed: {e}", Fore.RED)
+            return None
+        
+        for path in log_files:
+            os.remove(path)
+        
+        self.print_colored(f"✓ Compacted {len(events)} events from {len(log_files)} log(s) into: {parquet_path}", Fore.GREEN)
+        return parquet_path
+    
     def clear_screen(self):
         """Clear the terminal screen"""
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -343,9 +693,29 @@ Try asking questions in natural language - the system understands context!
         else:
             return str(field)
     
+    def normalize_facet_term(self, word):
+        """Lowercase and singularize a term so 'churches' matches 'church'"""
+        word = word.lower().strip('.,!?;:()"\'')
+        if len(word) > 4 and word.endswith('ies'):
+            return word[:-3] + 'y'
+        if len(word) > 4 and word.endswith(('ches', 'shes', 'sses', 'xes')):
+            return word[:-2]
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            return word[:-1]
+        return word
+    
+    def extract_facet_terms(self, text):
+        """Split a field value into normalized facet terms"""
+        terms = set()
+        for word in re.findall(r"[^\W_]+", text.lower()):
+            term = self.normalize_facet_term(word)
+            if len(term) > 2 and term not in FACET_STOPWORDS:
+                terms.add(term)
+        return terms
+    
     def download_from_lighthouse(self, cid, output_path):
         """Download a file from Lighthouse Storage using its CID"""
-        print(f"Fetching monument data from CID: {cid}")
+        self.log(f"Fetching monument data from CID: {cid}")
         gateway_url = f"https://gateway.lighthouse.storage/ipfs/{cid}"
         
         try:
@@ -354,13 +724,13 @@ Try asking questions in natural language - the system understands context!
             if response.status_code == 200:
                 with open(output_path, 'wb') as f:
                     f.write(response.content)
-                print(f"✓ Downloaded successfully: {os.path.basename(output_path)}")
+                self.log(f"✓ Downloaded successfully: {os.path.basename(output_path)}")
                 return True
             else:
-                print(f"✗ Download failed with status code: {response.status_code}")
+                self.log(f"✗ Download failed with status code: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"✗ Download error: {e}")
+            self.log(f"✗ Download error: {e}")
             return False
 
     def load_monument_data(self):
@@ -370,7 +740,7 @@ Try asking questions in natural language - the system understands context!
         # Try to load from Lighthouse first
         try:
             with tempfile.TemporaryDirectory() as temp_dir:
-                for i, cid in enumerate(MONUMENT_CIDS, 1):
+                for i, cid in enumerate(dict.fromkeys(MONUMENT_CIDS), 1):
                     file_path = os.path.join(temp_dir, f"monument_{i}.json")
                     
                     if self.download_from_lighthouse(cid, file_path):
@@ -384,23 +754,99 @@ Try asking questions in natural language - the system understands context!
                                 all_monuments.append(monument_data)
                                 
                         except json.JSONDecodeError as e:
-                            print(f"✗ Error parsing JSON from {file_path}: {e}")
+                            self.log(f"✗ Error parsing JSON from {file_path}: {e}")
                         except Exception as e:
-                            print(f"✗ Error loading {file_path}: {e}")
+                            self.log(f"✗ Error loading {file_path}: {e}")
         except Exception as e:
-            print(f"✗ Error accessing Lighthouse data: {e}")
+            self.log(f"✗ Error accessing Lighthouse data: {e}")
+        
+        self.remote_loaded = len(all_monuments)
         
         # If no monuments loaded or very few, use fallback data
         if len(all_monuments) < 3:
-            print("⚠️  Using fallback monument database with key Prague landmarks")
+            self.log("⚠️  Using fallback monument database with key Prague landmarks")
             all_monuments.extend(FALLBACK_MONUMENTS)
         
         self.monuments = all_monuments
         return all_monuments
 
+    def record_text(self, monument):
+        """Flatten a monument record into plain text"""
+        if isinstance(monument, dict):
+            return ' '.join(self.safe_string(value) for value in monument.values())
+        return self.safe_string(monument)
+    
+    def minhash_signature(self, text, coeff_a, coeff_b):
+        """MinHash signature over word-bigram shingles of the text"""
+        words = re.findall(r"[^\W_]+", text.lower())
+        shingles = {' '.join(words[i:i + 2]) for i in range(max(len(words) - 1, 1))}
+        hashes = np.array([zlib.crc32(shingle.encode('utf-8')) for shingle in shingles], dtype=np.uint64)
+        return ((np.outer(coeff_a, hashes) + coeff_b[:, None]) % np.uint64(MINHASH_PRIME)).min(axis=1)
+    
+    def deduplicate_monuments(self, monuments):
+        """Drop exact duplicates by content hash and collapse near-duplicates with MinHash/LSH"""
+        # Exact duplicates
+        unique = []
+        seen_hashes = set()
+        for monument in monuments:
+            canonical = json.dumps(monument, sort_keys=True, ensure_ascii=False, default=str)
+            digest = hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+            if digest not in seen_hashes:
+                seen_hashes.add(digest)
+                unique.append(monument)
+        exact_removed = len(monuments) - len(unique)
+        
+        # Near duplicates: band signatures into LSH buckets, verify candidates by signature agreement
+        rng = np.random.default_rng(MINHASH_SEED)
+        coeff_a = rng.integers(1, 2**32, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+        coeff_b = rng.integers(0, 2**32, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+        texts = [self.record_text(monument) for monument in unique]
+        signatures = [self.minhash_signature(text, coeff_a, coeff_b) for text in texts]
+        
+        parent = list(range(len(unique)))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+        buckets = defaultdict(list)
+        for i, signature in enumerate(signatures):
+            for band in range(MINHASH_BANDS):
+                buckets[(band, signature[band * rows:(band + 1) * rows].tobytes())].append(i)
+        
+        # Compare each bucket member against every group representative found so far in that bucket
+        for members in buckets.values():
+            representatives = []
+            for member in members:
+                for representative in representatives:
+                    root_a, root_b = find(representative), find(member)
+                    if root_a == root_b:
+                        break
+                    if np.mean(signatures[representative] == signatures[member]) >= NEAR_DUPLICATE_THRESHOLD:
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+                        break
+                else:
+                    representatives.append(member)
+        
+        # Keep the most detailed record of each group, in order of first appearance
+        groups = defaultdict(list)
+        for i in range(len(unique)):
+            groups[find(i)].append(i)
+        
+        deduplicated = [unique[max(members, key=lambda k: len(texts[k]))] for _, members in sorted(groups.items())]
+        
+        self.duplicates_merged = {'exact': exact_removed, 'near': len(unique) - len(deduplicated)}
+        return deduplicated
+
     def create_searchable_content(self):
         """Process monument data and create searchable text content"""
         monument_texts = []
+        monument_fields = []
+        monument_keywords = []
+        facet_postings = {facet: defaultdict(list) for facet in FACET_FIELDS}
         
         for i, monument in enumerate(self.monuments):
             name = self.safe_string(monument.get('name', ''))
@@ -439,6 +885,18 @@ Try asking questions in natural language - the system understands context!
             """.strip()
             
             monument_texts.append(full_text)
+            monument_fields.append({
+                'name': name,
+                'description': description,
+                'historical_period': historical_period,
+                'architecture_style': architecture_style,
+                'construction_year': construction_year,
+                'location': location,
+                'type': monument_type,
+                'significance': significance,
+                'historical_events': historical_events,
+                'notable_figures': notable_figures
+            })
             
             # Enhanced keyword indexing
             keywords = []
@@ -460,64 +918,425 @@ Try asking questions in natural language - the system understands context!
                 figure_words = [word.lower() for word in notable_figures.split() if len(word) > 2]
                 keywords.extend(figure_words)
             
-            for keyword in keywords:
-                if keyword and keyword.strip():
-                    self.keyword_index[keyword.strip()].append(i)
+            monument_keywords.append({keyword.strip() for keyword in keywords if keyword and keyword.strip()})
+            
+            # Facet postings for bitmap filters
+            facet_values = {'type': monument_type, 'style': architecture_style, 'period': historical_period}
+            for facet, value in facet_values.items():
+                for term in self.extract_facet_terms(value):
+                    facet_postings[facet][term].append(i)
         
         self.monument_texts = monument_texts
+        self.monument_fields = monument_fields
+        self.monument_keywords = monument_keywords
+        
+        # One boolean bitmap per facet value, aligned with self.monuments
+        self.facet_index = {}
+        for facet, postings in facet_postings.items():
+            self.facet_index[facet] = {}
+            for term, indices in postings.items():
+                bitmap = np.zeros(len(self.monuments), dtype=bool)
+                bitmap[indices] = True
+                self.facet_index[facet][term] = bitmap
 
     def build_tfidf_index(self):
         """Build TF-IDF index for semantic search"""
         self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=2000,
             stop_words='english',
-            ngram_range=(1, 3),
             lowercase=True,
             min_df=1,
-            max_df=0.95
+            **self.tfidf_params
         )
         
         self.tfidf_matrix = self.tfidf_vectorizer.fit_transform(self.monument_texts)
 
-    def find_relevant_monuments(self, question, top_k=3):
-        """Find most relevant monuments for a given question"""
+    def extract_query_facets(self, question):
+        """Detect facet values (type, style, period) mentioned in the question"""
+        question_terms = {self.normalize_facet_term(word) for word in re.findall(r"[^\W_]+", question.lower())}
+        
+        filters = {}
+        for facet, bitmaps in self.facet_index.items():
+            matched = sorted(question_terms & bitmaps.keys())
+            if matched:
+                filters[facet] = matched
+        return filters
+    
+    def build_candidate_mask(self, filters):
+        """Combine facet bitmaps: values within a facet are OR-ed, facets are AND-ed"""
+        mask = np.ones(len(self.monuments), dtype=bool)
+        
+        for facet, values in filters.items():
+            if facet not in FACET_FIELDS:
+                raise ValueError(f"Unknown facet: {facet}")
+            if isinstance(values, str):
+                values = [values]
+            
+            bitmaps = self.facet_index.get(facet, {})
+            facet_mask = np.zeros(len(self.monuments), dtype=bool)
+            for value in values:
+                bitmap = bitmaps.get(self.normalize_facet_term(value))
+                if bitmap is not None:
+                    facet_mask |= bitmap
+            mask &= facet_mask
+        
+        return mask
+
+    def tokenize(self, text):
+        """Lowercase word tokens without English stop words"""
+        return [word for word in re.findall(r"[^\W_]+", text.lower()) if word not in ENGLISH_STOP_WORDS]
+    
+    def build_bm25f_index(self):
+        """Build BM25F postings with precomputed impacts from separately indexed fields"""
+        n_docs = len(self.monument_fields)
+        field_tokens = [{field: self.tokenize(text) for field, text in fields.items()} for fields in self.monument_fields]
+        
+        # Per-field length norms
+        avg_lengths = {}
+        for field in BM25F_FIELD_WEIGHTS:
+            total = sum(len(doc.get(field, [])) for doc in field_tokens)
+            avg_lengths[field] = (total / n_docs if n_docs else 0) or 1.0
+        
+        weighted_tf = defaultdict(lambda: defaultdict(float))
+        for doc_id, doc in enumerate(field_tokens):
+            for field, tokens in doc.items():
+                weight = self.bm25f_weights.get(field, 0.0)
+                if not weight or not tokens:
+                    continue
+                length_norm = 1 - BM25F_B + BM25F_B * len(tokens) / avg_lengths[field]
+                for term, count in Counter(tokens).items():
+                    weighted_tf[term][doc_id] += weight * count / length_norm
+        
+        # Precompute each term's contribution per document, sorted by document id
+        postings = {}
+        for term, doc_tfs in weighted_tf.items():
+            df = len(doc_tfs)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            doc_ids = np.fromiter(doc_tfs.keys(), dtype=np.int64, count=df)
+            tfs = np.fromiter(doc_tfs.values(), dtype=float, count=df)
+            impacts = idf * tfs / (BM25F_K1 + tfs)
+            order = np.argsort(doc_ids, kind='stable')
+            postings[term] = (doc_ids[order], impacts[order])
+        
+        self.bm25f_postings = postings
+    
+    def score_bm25f(self, question, candidates):
+        """BM25F scores for the (sorted) candidate monuments against the complete postings
+        
+        Each term costs O(min(df, candidates) * log(max(df, candidates))), so filtered
+        queries only pay for the candidate set.
+        """
+        scores = np.zeros(len(candidates))
+        for term in set(self.tokenize(question)):
+            if term not in self.bm25f_postings:
+                continue
+            doc_ids, impacts = self.bm25f_postings[term]
+            
+            if len(doc_ids) <= len(candidates):
+                # Walk the postings and locate each document in the candidate set
+                positions = np.minimum(np.searchsorted(candidates, doc_ids), len(candidates) - 1)
+                hits = candidates[positions] == doc_ids
+                scores[positions[hits]] += impacts[hits]
+            else:
+                # Walk the candidates and look each one up in the postings
+                positions = np.minimum(np.searchsorted(doc_ids, candidates), len(doc_ids) - 1)
+                hits = doc_ids[positions] == candidates
+                scores[hits] += impacts[positions[hits]]
+        return scores
+    
+    def score_tfidf(self, question, candidates):
+        """TF-IDF cosine scores with keyword boosts for the candidate monuments"""
         question_vector = self.tfidf_vectorizer.transform([question])
-        similarities = cosine_similarity(question_vector, self.tfidf_matrix).flatten()
+        similarities = cosine_similarity(question_vector, self.tfidf_matrix[candidates]).flatten()
         
-        # Enhanced keyword matching
+        # Enhanced keyword matching, only over the candidates' own keywords
         question_words = set(question.lower().split())
-        keyword_matches = []
+        long_words = [word for word in question_words if len(word) > 3]
         
-        for word in question_words:
+        def matches(keyword):
             # Direct keyword match
-            if word in self.keyword_index:
-                keyword_matches.extend(self.keyword_index[word])
-            
-            # Partial keyword matching for monument names
-            for keyword in self.keyword_index.keys():
-                if word in keyword or keyword in word:
-                    if len(word) > 3 and len(keyword) > 3:  # Avoid short word matches
-                        keyword_matches.extend(self.keyword_index[keyword])
+            if keyword in question_words:
+                return True
+            # Partial keyword matching for monument names, avoiding short word matches
+            return len(keyword) > 3 and any(word in keyword or keyword in word for word in long_words)
         
         # Boost scores for keyword matches
-        for idx in set(keyword_matches):
-            if idx < len(similarities):
-                similarities[idx] += 0.2
+        for pos, idx in enumerate(candidates):
+            if any(matches(keyword) for keyword in self.monument_keywords[idx]):
+                similarities[pos] += self.keyword_boost
+        
+        return similarities
+
+    def fold_diacritics(self, text):
+        """Strip diacritics so 'Karlův' and 'Karluv' analyze the same"""
+        return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    
+    def detect_language(self, question):
+        """Guess the question language from stop words, using Czech diacritics as weak evidence
+        
+        A question is only routed to Czech if it contains at least one Czech function word;
+        ties go to English.
+        """
+        words = re.findall(r"[^\W_]+", question.lower())
+        english_hits = sum(word in ENGLISH_STOP_WORDS for word in words)
+        czech_stop_hits = sum(self.fold_diacritics(word) in CZECH_STOP_WORDS for word in words)
+        diacritic_hits = sum(bool(CZECH_CHARACTERS & set(word)) for word in words)
+        czech_score = czech_stop_hits + DIACRITIC_EVIDENCE_WEIGHT * diacritic_hits
+        return 'cs' if czech_stop_hits and czech_score > english_hits else 'en'
+    
+    def czech_analyzer(self, text):
+        """Diacritic-folded, lightly stemmed Czech unigrams and bigrams"""
+        stems = []
+        for word in re.findall(r"[^\W_]+", self.fold_diacritics(text.lower())):
+            if word in CZECH_STOP_WORDS:
+                continue
+            for suffix in CZECH_SUFFIXES:
+                if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                    word = word[:-len(suffix)]
+                    break
+            stems.append(word)
+        return stems + [f"{first} {second}" for first, second in zip(stems, stems[1:])]
+    
+    def language_document(self, monument, language):
+        """Searchable text in the given language, falling back to the original fields"""
+        translations = monument.get('translations', {})
+        localized = translations.get(language, {}) if isinstance(translations, dict) else {}
+        
+        def field(key):
+            return self.safe_string(localized.get(key, monument.get(key, '')))
+        
+        name = field('name')
+        parts = [name, name]  # Repeat the name so name matches outweigh passing mentions
+        parts += [field(key) for key in ('type', 'description', 'location', 'historical_period',
+                                         'architecture_style', 'significance', 'notable_figures')]
+        return ' '.join(parts)
+    
+    def get_language_shard(self, language):
+        """Return the index shard for a language, building it on first use"""
+        with self.index_lock:
+            shard = self.language_shards.get(language)
+            if shard is None:
+                vectorizer = TfidfVectorizer(analyzer=getattr(self, LANGUAGE_ANALYZERS[language]))
+                documents = [self.language_document(monument, language) for monument in self.monuments]
+                shard = {'vectorizer': vectorizer, 'matrix': vectorizer.fit_transform(documents)}
+                self.language_shards[language] = shard
+            return shard
+    
+    def score_language_shard(self, question, candidates, language):
+        """TF-IDF cosine scores from a language-specific shard"""
+        shard = self.get_language_shard(language)
+        question_vector = shard['vectorizer'].transform([question])
+        return cosine_similarity(question_vector, shard['matrix'][candidates]).flatten()
+
+    def facet_boosts(self, facets, candidates):
+        """FACET_BOOST for each facet the candidate matches (values within a facet are OR-ed)"""
+        boosts = np.zeros(len(candidates))
+        for facet, values in facets.items():
+            bitmaps = self.facet_index.get(facet, {})
+            facet_hits = np.zeros(len(candidates), dtype=bool)
+            for value in values:
+                bitmap = bitmaps.get(value)
+                if bitmap is not None:
+                    facet_hits |= bitmap[candidates]
+            boosts += FACET_BOOST * facet_hits
+        return boosts
+
+    def find_relevant_monuments(self, question, top_k=3, filters=None):
+        """Find most relevant monuments for a given question
+        
+        Explicit filters ({facet: [values]}) restrict the candidate set; without them,
+        facets mentioned in the question only boost monuments that already match it.
+        """
+        self.last_filters = {}
+        self.last_facet_boosts = {}
+        
+        if filters:
+            candidates = np.flatnonzero(self.build_candidate_mask(filters))
+            self.last_filters = filters
+        else:
+            candidates = np.arange(len(self.monuments))
+        
+        if len(candidates) == 0:
+            return []
+        
+        # Score only the surviving candidates
+        self.last_language = self.detect_language(question)
+        if self.last_language in LANGUAGE_ANALYZERS:
+            self.last_engine = f"tfidf-{self.last_language}"
+            similarities = self.score_language_shard(question, candidates, self.last_language)
+        elif self.ranker == 'bm25f':
+            self.last_engine = 'bm25f'
+            similarities = self.score_bm25f(question, candidates)
+        else:
+            self.last_engine = 'tfidf'
+            similarities = self.score_tfidf(question, candidates)
+        
+        if not filters:
+            detected = self.extract_query_facets(question)
+            if detected:
+                similarities += self.facet_boosts(detected, candidates) * (similarities > 0)
+                self.last_facet_boosts = detected
         
         # Get top results
-        top_indices = similarities.argsort()[-top_k:][::-1]
+        top_positions = similarities.argsort()[-top_k:][::-1]
         
         results = []
-        for idx in top_indices:
-            if similarities[idx] > 0.01:  # Lower threshold for better recall
+        for pos in top_positions:
+            if similarities[pos] > self.score_threshold:
+                idx = candidates[pos]
                 results.append({
                     'monument': self.monuments[idx],
                     'text': self.monument_texts[idx],
-                    'score': similarities[idx]
+                    'score': similarities[pos]
                 })
         
         return results
 
+    def build_index(self, monuments):
+        """Build all search structures for the given monuments"""
+        self.monuments = self.deduplicate_monuments(monuments)
+        self.language_shards = {}
+        self.create_searchable_content()
+        self.build_tfidf_index()
+        self.build_bm25f_index()
+    
+    def adopt_index(self, state):
+        """Atomically swap in search structures from a state dict"""
+        with self.index_lock:
+            for attr in INDEX_STATE_ATTRS:
+                setattr(self, attr, state[attr])
+            self.language_shards = {}
+    
+    def report_duplicates(self):
+        """Print how many duplicate records were merged during the last build"""
+        exact, near = self.duplicates_merged['exact'], self.duplicates_merged['near']
+        if exact or near:
+            self.print_colored(f"🧹 Merged {exact + near} duplicate record(s) ({exact} exact, {near} near-duplicate)", Fore.YELLOW)
+    
+    def save_index(self, path=INDEX_CACHE_PATH):
+        """Persist the current search index for the next startup"""
+        with self.index_lock:
+            state = {attr: getattr(self, attr) for attr in INDEX_STATE_ATTRS}
+        try:
+            joblib.dump(state, path)
+            return True
+        except Exception as e:
+            self.log(f"✗ Could not save search index: {e}")
+            return False
+    
+    def load_saved_index(self, path=INDEX_CACHE_PATH):
+        """Load a previously persisted search index, if one is usable"""
+        if not os.path.exists(path):
+            return False
+        
+        try:
+            state = joblib.load(path)
+        except Exception as e:
+            self.log(f"✗ Could not load saved index {path}: {e}")
+            return False
+        
+        if not isinstance(state, dict) or any(attr not in state for attr in INDEX_STATE_ATTRS):
+            return False
+        
+        self.adopt_index(state)
+        return bool(self.monuments)
+    
+    def refresh_index_in_background(self):
+        """Load remote monument data and swap in the richer index when ready"""
+        def worker():
+            try:
+                staging = EnhancedPragueQnA()
+                staging.verbose = False
+                staging.bm25f_weights = dict(self.bm25f_weights)
+                monuments = staging.load_monument_data()
+                
+                if not staging.remote_loaded:
+                    self.print_colored("\n⚠️  Lighthouse data unavailable, keeping the current index", Fore.YELLOW)
+                    return
+                
+                staging.build_index(monuments)
+                with self.index_lock:
+                    # Weights may have been changed with 'weights' while the data was loading
+                    if staging.bm25f_weights != self.bm25f_weights:
+                        staging.bm25f_weights = dict(self.bm25f_weights)
+                        staging.build_bm25f_index()
+                    self.adopt_index({attr: getattr(staging, attr) for attr in INDEX_STATE_ATTRS})
+                self.index_source = 'remote'
+                self.duplicates_merged = staging.duplicates_merged
+                self.save_index()
+                self.print_colored(f"\n✅ Lighthouse data loaded, index updated ({len(staging.monuments)} monument records)", Fore.GREEN)
+                self.report_duplicates()
+            except Exception as e:
+                self.print_colored(f"\n✗ Background data load failed: {e}", Fore.RED)
+        
+        self.loader_thread = threading.Thread(target=worker, name='monument-loader', daemon=True)
+        self.loader_thread.start()
+        return self.loader_thread
+
+    def index_size_bytes(self):
+        """Memory held by the TF-IDF matrix"""
+        matrix = self.tfidf_matrix
+        return int(matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes)
+    
+    def evaluate_retrieval(self, labelled, k=3):
+        """Recall@k, MRR and query latency over labelled {question, relevant} items"""
+        recalls, reciprocal_ranks, latencies = [], [], []
+        
+        for item in labelled:
+            relevant = set(item['relevant'])
+            start = time.perf_counter()
+            results = self.find_relevant_monuments(item['question'], top_k=k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            
+            ranked = [self.monument_id(result['monument']) for result in results]
+            recalls.append(len(relevant & set(ranked)) / len(relevant) if relevant else 0.0)
+            reciprocal_ranks.append(next((1 / rank for rank, mid in enumerate(ranked, 1) if mid in relevant), 0.0))
+        
+        return {
+            f'recall@{k}': float(np.mean(recalls)),
+            'mrr': float(np.mean(reciprocal_ranks)),
+            'latency_ms_mean': float(np.mean(latencies)),
+            'latency_ms_p95': float(np.percentile(latencies, 95))
+        }
+    
+    def run_parameter_sweep(self, labelled, grid=None, k=3):
+        """Evaluate every combination of TF-IDF and scoring settings in the grid"""
+        grid = {**SWEEP_GRID, **(grid or {})}
+        index_keys = ('max_features', 'ngram_range', 'max_df')
+        original = (self.ranker, dict(self.tfidf_params), self.keyword_boost, self.score_threshold)
+        self.ranker = 'tfidf'
+        rows = []
+        
+        try:
+            for index_values in itertools.product(*(grid[key] for key in index_keys)):
+                index_params = dict(zip(index_keys, index_values))
+                self.tfidf_params = index_params
+                
+                start = time.perf_counter()
+                try:
+                    self.build_tfidf_index()
+                except ValueError as e:
+                    self.print_colored(f"✗ Skipping {index_params}: {e}", Fore.YELLOW)
+                    continue
+                build_ms = (time.perf_counter() - start) * 1000
+                
+                for boost, threshold in itertools.product(grid['keyword_boost'], grid['score_threshold']):
+                    self.keyword_boost = boost
+                    self.score_threshold = threshold
+                    rows.append({
+                        **index_params,
+                        'keyword_boost': boost,
+                        'score_threshold': threshold,
+                        'vocabulary': len(self.tfidf_vectorizer.vocabulary_),
+                        'index_bytes': self.index_size_bytes(),
+                        'build_ms': build_ms,
+                        **self.evaluate_retrieval(labelled, k)
+                    })
+        finally:
+            self.ranker, self.tfidf_params, self.keyword_boost, self.score_threshold = original
+            self.build_tfidf_index()
+        
+        return pd.DataFrame(rows)
+
     def generate_enhanced_answer(self, question, relevant_monuments):
         """Generate enhanced, descriptive answers based on relevant monuments"""
         if not relevant_monuments:
@@ -546,7 +1365,7 @@ Try asking questions in natural language - the system understands context!
         historical_events = monument.get('historical_events', [])
         
         # Question type detection and enhanced responses
-        if any(word in question_lower for word in ['when', 'year', 'built', 'constructed', 'date']):
+        if any(word in question_lower for word in ['when', 'year', 'built', 'constructed', 'date', 'kdy', 'postaven']):
             answer_parts = []
             for result in relevant_monuments:
                 m = result['monument']
@@ -570,7 +1389,7 @@ Try asking questions in natural language - the system understands context!
             else:
                 return f"Construction dates are not available for {name}, but it dates from the {period} period." if period else "Construction date information is not available."
         
-        elif any(word in question_lower for word in ['where', 'location', 'address', 'find', 'located']):
+        elif any(word in question_lower for word in ['where', 'location', 'address', 'find', 'located', 'kde', 'adresa']):
             answer_parts = []
             for result in relevant_monuments:
                 m = result['monument']
@@ -588,7 +1407,7 @@ Try asking questions in natural language - the system understands context!
             else:
                 return "Location information is not available in the database."
         
-        elif any(word in question_lower for word in ['who', 'architect', 'designer', 'builder', 'founded', 'emperor', 'king']):
+        elif any(word in question_lower for word in ['who', 'architect', 'designer', 'builder', 'founded', 'emperor', 'king', 'kdo', 'založil', 'postavil']):
             answer_parts = []
             for result in relevant_monuments:
                 m = result['monument']
@@ -609,7 +1428,7 @@ Try asking questions in natural language - the system understands context!
             else:
                 return f"Information about the people associated with {name} is not available in the database."
         
-        elif any(word in question_lower for word in ['style', 'architecture', 'architectural', 'gothic', 'baroque', 'renaissance']):
+        elif any(word in question_lower for word in ['style', 'architecture', 'architectural', 'gothic', 'baroque', 'renaissance', 'styl', 'sloh']):
             answer_parts = []
             for result in relevant_monuments:
                 m = result['monument']
@@ -680,9 +1499,14 @@ Try asking questions in natural language - the system understands context!
             
             return answer
 
-    def answer_question(self, question):
+    def answer_question(self, question, filters=None):
         """Answer a question and update statistics"""
-        relevant_monuments = self.find_relevant_monuments(question, top_k=3)
+        if filters is None:
+            filters = self.active_filters
+        start = time.perf_counter()
+        with self.index_lock:
+            relevant_monuments = self.find_relevant_monuments(question, top_k=3, filters=filters)
+        latency_ms = (time.perf_counter() - start) * 1000
         
         if not relevant_monuments:
             answer = self.generate_enhanced_answer(question, [])
@@ -700,11 +1524,22 @@ Try asking questions in natural language - the system understands context!
         # Update session stats and history
         self.session_stats['questions_asked'] += 1
         self.question_history.append((datetime.now(), question, monument_count))
+        self.log_event(question, relevant_monuments, latency_ms)
         
         # Display answer
         self.print_colored(f"\n💡 Answer:", Fore.GREEN, Style.BRIGHT)
         self.print_colored(answer, Fore.WHITE)
         
+        if self.last_filters:
+            applied = ', '.join(
+                f"{facet}={values if isinstance(values, str) else '|'.join(values)}"
+                for facet, values in self.last_filters.items()
+            )
+            self.print_colored(f"\n🔎 Filtered by: {applied}", Fore.BLUE)
+        elif self.last_facet_boosts:
+            boosted = ', '.join(f"{facet}={'|'.join(values)}" for facet, values in self.last_facet_boosts.items())
+            self.print_colored(f"\n🔎 Boosted facets: {boosted}", Fore.BLUE)
+        
         if relevant_monuments:
             self.print_colored(f"\n📊 Based on {len(relevant_monuments)} relevant monument(s):", Fore.BLUE)
             for i, result in enumerate(relevant_monuments, 1):
@@ -716,26 +1551,40 @@ Try asking questions in natural language - the system understands context!
         
         return answer
 
-    def initialize_system(self):
-        """Initialize the QnA system"""
-        self.print_banner()
-        
-        # Load data
-        self.print_colored("🔄 Loading monument data from Lighthouse...", Fore.YELLOW)
-        monuments = self.load_monument_data()
-        
-        if not monuments:
-            self.print_colored("❌ No monument data loaded. Please check your CIDs.", Fore.RED)
-            return False
+    def initialize_system(self, background=True):
+        """Initialize the QnA system
         
-        self.print_colored(f"✅ Loaded {len(monuments)} monument records", Fore.GREEN)
-        
-        # Process data
-        self.print_colored("🔄 Creating searchable content...", Fore.YELLOW)
-        self.create_searchable_content()
+        With background=True the prompt is available immediately, answering from the
+        last saved index (or the fallback monuments) while Lighthouse data loads.
+        """
+        self.print_banner()
         
-        self.print_colored("🔄 Building search index...", Fore.YELLOW)
-        self.build_tfidf_index()
+        if not background:
+            self.print_colored("🔄 Loading monument data from Lighthouse...", Fore.YELLOW)
+            monuments = self.load_monument_data()
+            
+            if not monuments:
+                self.print_colored("❌ No monument data loaded. Please check your CIDs.", Fore.RED)
+                return False
+            
+            self.print_colored(f"✅ Loaded {len(monuments)} monument records", Fore.GREEN)
+            
+            self.print_colored("🔄 Creating searchable content and building search index...", Fore.YELLOW)
+            self.build_index(monuments)
+            self.report_duplicates()
+            self.index_source = 'remote' if self.remote_loaded else 'fallback'
+            self.save_index()
+        else:
+            self.print_colored("🔄 Loading search index...", Fore.YELLOW)
+            if self.load_saved_index():
+                self.index_source = 'cache'
+            else:
+                self.build_index(list(FALLBACK_MONUMENTS))
+                self.index_source = 'fallback'
+            
+            self.print_colored(f"✅ Loaded {len(self.monuments)} monument records ({self.index_source} index)", Fore.GREEN)
+            self.print_colored("🔄 Loading monument data from Lighthouse in the background...", Fore.YELLOW)
+            self.refresh_index_in_background()
         
         self.print_colored("✅ Enhanced QnA system ready!", Fore.GREEN, Style.BRIGHT)
         self.print_colored("Type 'help' for commands or 'samples' for detailed question examples.\n", Fore.CYAN)
@@ -781,6 +1630,21 @@ Try asking questions in natural language - the system understands context!
                 elif command == 'export':
                     self.export_session()
                 
+                elif command == 'compact':
+                    self.compact_session_logs()
+                
+                elif command in ['filters', 'facets']:
+                    self.show_facets()
+                
+                elif command == 'filter' or command.startswith('filter '):
+                    self.set_filters(command.split()[1:])
+                
+                elif command == 'ranker' or command.startswith('ranker '):
+                    self.set_ranker(command.split()[1:])
+                
+                elif command == 'weights' or command.startswith('weights '):
+                    self.set_field_weights(command.split()[1:])
+                
                 elif command in ['clear', 'cls']:
                     self.clear_screen()
                 
@@ -799,9 +1663,58 @@ Try asking questions in natural language - the system understands context!
                 self.print_colored(f"\n❌ An error occurred: {e}", Fore.RED)
                 self.print_colored("Please try again or type 'help' for assistance.", Fore.YELLOW)
 
+def run_evaluation(args):
+    """Sweep retrieval settings over a labelled question set and report quality vs cost"""
+    qna_system = EnhancedPragueQnA()
+    qna_system.event_log_dir = None
+    
+    if args.evaluate:
+        with open(args.evaluate, 'r', encoding='utf-8') as f:
+            labelled = json.load(f)
+    else:
+        labelled = EVAL_QUESTIONS
+    
+    monuments = qna_system.load_monument_data() if args.remote else list(FALLBACK_MONUMENTS)
+    qna_system.build_index(monuments)
+    print(f"Evaluating {len(labelled)} questions against {len(qna_system.monuments)} monuments...")
+    
+    results = qna_system.run_parameter_sweep(labelled, k=args.k)
+    if results.empty:
+        print("❌ No parameter combination could be evaluated.")
+        return
+    
+    results = results.sort_values(['mrr', f'recall@{args.k}', 'latency_ms_p95'], ascending=[False, False, True])
+    with pd.option_context('display.max_rows', None, 'display.width', 200):
+        print(results.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    
+    if args.latency_budget is not None:
+        within_budget = results[results['latency_ms_p95'] <= args.latency_budget]
+        if within_budget.empty:
+            print(f"\n⚠️  No setting meets the {args.latency_budget} ms p95 latency budget")
+        else:
+            print(f"\n✅ Best setting within {args.latency_budget} ms p95 latency:")
+            print(within_budget.head(1).to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    
+    if args.output:
+        results.to_csv(args.output, index=False)
+        print(f"✓ Sweep results written to: {args.output}")
+
 def main():
     """Main function to run the interactive CLI"""
+    parser = argparse.ArgumentParser(description="Prague Monuments QnA")
+    parser.add_argument('--evaluate', nargs='?', const='', metavar='LABELS_JSON',
+                        help="run the retrieval parameter sweep, optionally on a JSON list of {question, relevant} items")
+    parser.add_argument('--k', type=int, default=3, help="cutoff for recall@k and MRR (default: 3)")
+    parser.add_argument('--latency-budget', type=float, metavar='MS', help="report the best setting within this p95 latency")
+    parser.add_argument('--output', metavar='CSV', help="write sweep results to a CSV file")
+    parser.add_argument('--remote', action='store_true', help="evaluate on Lighthouse data instead of the fallback monuments")
+    args = parser.parse_args()
+    
     try:
+        if args.evaluate is not None:
+            run_evaluation(args)
+            return
+        
         qna_system = EnhancedPragueQnA()
         qna_system.run_interactive_session()
     except Exception as e: